@@ -55,15 +55,11 @@ def convert_a2a_request_to_adk_run_args(
   if not request.message:
     raise ValueError('Request message cannot be None')
 
+  parts = list(map(convert_a2a_part_to_genai_part, request.message.parts))
+
   return {
       'user_id': _get_user_id(request),
       'session_id': request.context_id,
-      'new_message': genai_types.Content(
-          role='user',
-          parts=[
-              convert_a2a_part_to_genai_part(part)
-              for part in request.message.parts
-          ],
-      ),
+      'new_message': genai_types.Content(role='user', parts=parts),
       'run_config': RunConfig(),
   }
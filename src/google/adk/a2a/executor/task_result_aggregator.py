@@ -21,11 +21,21 @@ from a2a.types import TaskStatusUpdateEvent
 
 from ..experimental import a2a_experimental
 
+# Higher priority task states cannot be overwritten by lower priority ones.
+_TASK_STATE_PRIORITY = {
+    TaskState.failed: 3,
+    TaskState.auth_required: 2,
+    TaskState.input_required: 1,
+    TaskState.working: 0,
+}
+
 
 @a2a_experimental
 class TaskResultAggregator:
   """Aggregates the task status updates and provides the final task state."""
 
+  __slots__ = ('_task_state', '_task_status_message')
+
   def __init__(self):
     self._task_state = TaskState.working
     self._task_status_message = None
@@ -39,27 +49,17 @@ class TaskResultAggregator:
     - working
     """
     if isinstance(event, TaskStatusUpdateEvent):
-      if event.status.state == TaskState.failed:
-        self._task_state = TaskState.failed
-        self._task_status_message = event.status.message
-      elif (
-          event.status.state == TaskState.auth_required
-          and self._task_state != TaskState.failed
-      ):
-        self._task_state = TaskState.auth_required
-        self._task_status_message = event.status.message
-      elif (
-          event.status.state == TaskState.input_required
-          and self._task_state
-          not in (TaskState.failed, TaskState.auth_required)
-      ):
-        self._task_state = TaskState.input_required
+      priority = _TASK_STATE_PRIORITY.get(event.status.state, 0)
+      if priority >= _TASK_STATE_PRIORITY[self._task_state]:
+        # States outside the priority table are never recorded, so the
+        # aggregated state stays working until a higher priority state
+        # arrives.
+        if priority:
+          self._task_state = event.status.state
         self._task_status_message = event.status.message
       # final state is already recorded and make sure the intermediate state is
       # always working because other state may terminate the event aggregation
       # in a2a request handler
-      elif self._task_state == TaskState.working:
-        self._task_status_message = event.status.message
       event.status.state = TaskState.working
 
   @property
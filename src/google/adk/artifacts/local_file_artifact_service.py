@@ -23,10 +23,13 @@ The file path format used depends on whether the filename has a user namespace:
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 import json
 import logging
+import os
 from pathlib import Path
 import shutil
+from typing import Iterator
 from typing import Optional
 
 from google.genai import types
@@ -36,6 +39,72 @@ from .base_artifact_service import BaseArtifactService
 
 logger = logging.getLogger("google_adk." + __name__)
 
+# Artifacts at or above this size are written with a preallocated file and
+# are never kept in the load cache.
+_LARGE_ARTIFACT_SIZE_BYTES = 1 << 20
+
+# Maximum number of loaded artifact versions, and their total artifact bytes,
+# kept in the load cache per service.
+_LOAD_CACHE_MAX_ENTRIES = 256
+_LOAD_CACHE_MAX_BYTES = 16 << 20
+
+# The (mtime_ns, inode, size) of an artifact data file, used to tell whether a
+# cached version is still the one on disk.
+_FileSignature = tuple[int, int, int]
+
+
+def _file_signature(stat_result: os.stat_result) -> _FileSignature:
+  """Returns the signature identifying a version of an artifact data file."""
+  return (stat_result.st_mtime_ns, stat_result.st_ino, stat_result.st_size)
+
+
+def _read_artifact_data(path: Path) -> tuple[bytes, _FileSignature]:
+  """Reads artifact bytes along with the signature of the file they came from.
+
+  Args:
+      path: The artifact data file.
+
+  Returns:
+      The artifact bytes and the signature of the file they were read from.
+  """
+  with open(path, "rb") as f:
+    signature = _file_signature(os.fstat(f.fileno()))
+    return f.read(), signature
+
+
+def _write_artifact_data(path: Path, data: bytes) -> None:
+  """Writes artifact bytes to a file.
+
+  Large artifacts are written straight to the file descriptor, after
+  preallocating their size where the platform supports it, to avoid
+  fragmenting the file while it grows.
+
+  Args:
+      path: The file to write.
+      data: The artifact bytes.
+  """
+  if len(data) < _LARGE_ARTIFACT_SIZE_BYTES:
+    path.write_bytes(data)
+    return
+
+  fd = os.open(
+      path,
+      os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+      0o644,
+  )
+  try:
+    if hasattr(os, "posix_fallocate"):
+      try:
+        os.posix_fallocate(fd, 0, len(data))
+      except OSError:
+        # Preallocation is an optimization; not every filesystem supports it.
+        pass
+    view = memoryview(data)
+    while view:
+      view = view[os.write(fd, view) :]
+  finally:
+    os.close(fd)
+
 
 class LocalFileArtifactService(BaseArtifactService):
   """An artifact service implementation using the local file system."""
@@ -49,6 +118,16 @@ class LocalFileArtifactService(BaseArtifactService):
     """
     self.base_path = Path(base_path).resolve()
     self.base_path.mkdir(parents=True, exist_ok=True)
+    # Loaded versions are cached by their directory and version number. Other
+    # processes may share base_path, so every hit is checked against the data
+    # file's signature before it is returned.
+    self._load_cache: OrderedDict[
+        tuple[Path, int], tuple[_FileSignature, types.Part]
+    ] = OrderedDict()
+    self._load_cache_bytes = 0
+    # Bumped on every save and delete so that a load that raced with either
+    # does not cache what it read.
+    self._write_generation = 0
 
   @override
   async def save_artifact(
@@ -60,6 +139,7 @@ class LocalFileArtifactService(BaseArtifactService):
       filename: str,
       artifact: types.Part,
   ) -> int:
+    self._write_generation += 1
     return await asyncio.to_thread(
         self._save_artifact,
         app_name,
@@ -79,14 +159,64 @@ class LocalFileArtifactService(BaseArtifactService):
       filename: str,
       version: Optional[int] = None,
   ) -> Optional[types.Part]:
-    return await asyncio.to_thread(
-        self._load_artifact,
-        app_name,
-        user_id,
-        session_id,
-        filename,
-        version,
+    artifact_dir = self._get_artifact_dir(
+        app_name, user_id, session_id, filename
     )
+    if version is None:
+      version = await asyncio.to_thread(self._max_version, artifact_dir)
+      if version < 0:
+        return None
+
+    artifact_file_path = self._get_artifact_file_path(artifact_dir, version)
+    cache_key = (artifact_dir, version)
+    if (cached := self._load_cache.get(cache_key)) is not None:
+      cached_signature, artifact = cached
+      try:
+        stat_result = await asyncio.to_thread(os.stat, artifact_file_path)
+      except OSError:
+        stat_result = None
+      if (
+          stat_result is not None
+          and _file_signature(stat_result) == cached_signature
+      ):
+        self._load_cache.move_to_end(cache_key)
+        return artifact
+      self._evict_cached_artifact(cache_key)
+
+    metadata_file_path = self._get_metadata_file_path(artifact_dir, version)
+    write_generation = self._write_generation
+
+    # The data and metadata files are independent, so read them concurrently.
+    try:
+      (artifact_data, signature), metadata_bytes = await asyncio.gather(
+          asyncio.to_thread(_read_artifact_data, artifact_file_path),
+          asyncio.to_thread(metadata_file_path.read_bytes),
+      )
+      metadata = json.loads(metadata_bytes)
+
+      artifact = types.Part.from_bytes(
+          data=artifact_data, mime_type=metadata["mime_type"]
+      )
+    except FileNotFoundError:
+      return None
+    except (OSError, json.JSONDecodeError, KeyError):
+      logger.warning(
+          "Failed to load artifact %s for app %s, user %s, session %s,"
+          " version %d",
+          filename,
+          app_name,
+          user_id,
+          session_id,
+          version,
+      )
+      return None
+
+    if (
+        write_generation == self._write_generation
+        and len(artifact_data) < _LARGE_ARTIFACT_SIZE_BYTES
+    ):
+      self._cache_artifact(cache_key, signature, artifact)
+    return artifact
 
   @override
   async def list_artifact_keys(
@@ -103,13 +233,22 @@ class LocalFileArtifactService(BaseArtifactService):
   async def delete_artifact(
       self, *, app_name: str, user_id: str, session_id: str, filename: str
   ) -> None:
-    return await asyncio.to_thread(
+    self._write_generation += 1
+    await asyncio.to_thread(
         self._delete_artifact,
         app_name,
         user_id,
         session_id,
         filename,
     )
+    # Deleting a directory also deletes artifacts nested below it.
+    artifact_dir = self._get_artifact_dir(
+        app_name, user_id, session_id, filename
+    )
+    for cache_key in list(self._load_cache):
+      cached_dir = cache_key[0]
+      if cached_dir == artifact_dir or artifact_dir in cached_dir.parents:
+        self._evict_cached_artifact(cache_key)
 
   @override
   async def list_versions(
@@ -123,6 +262,38 @@ class LocalFileArtifactService(BaseArtifactService):
         filename,
     )
 
+  def _cache_artifact(
+      self,
+      cache_key: tuple[Path, int],
+      signature: _FileSignature,
+      artifact: types.Part,
+  ) -> None:
+    """Caches a loaded artifact version, evicting the oldest to stay in budget.
+
+    Args:
+        cache_key: The artifact directory and version.
+        signature: The signature of the data file the artifact was read from.
+        artifact: The loaded artifact.
+    """
+    self._evict_cached_artifact(cache_key)
+    self._load_cache[cache_key] = (signature, artifact)
+    self._load_cache_bytes += len(artifact.inline_data.data)
+    while (
+        len(self._load_cache) > _LOAD_CACHE_MAX_ENTRIES
+        or self._load_cache_bytes > _LOAD_CACHE_MAX_BYTES
+    ):
+      _, (_, evicted) = self._load_cache.popitem(last=False)
+      self._load_cache_bytes -= len(evicted.inline_data.data)
+
+  def _evict_cached_artifact(self, cache_key: tuple[Path, int]) -> None:
+    """Removes an artifact version from the load cache, if it is cached.
+
+    Args:
+        cache_key: The artifact directory and version.
+    """
+    if (cached := self._load_cache.pop(cache_key, None)) is not None:
+      self._load_cache_bytes -= len(cached[1].inline_data.data)
+
   def _file_has_user_namespace(self, filename: str) -> bool:
     """Checks if the filename has a user namespace.
 
@@ -154,57 +325,31 @@ class LocalFileArtifactService(BaseArtifactService):
         The constructed directory path.
     """
     if self._file_has_user_namespace(filename):
-      return self.base_path / app_name / user_id / "user" / filename
-    return self.base_path / app_name / user_id / session_id / filename
+      return self.base_path.joinpath(app_name, user_id, "user", filename)
+    return self.base_path.joinpath(app_name, user_id, session_id, filename)
 
-  def _get_artifact_file_path(
-      self,
-      app_name: str,
-      user_id: str,
-      session_id: str,
-      filename: str,
-      version: int,
-  ) -> Path:
+  def _get_artifact_file_path(self, artifact_dir: Path, version: int) -> Path:
     """Constructs the full file path for an artifact version.
 
     Args:
-        app_name: The name of the application.
-        user_id: The ID of the user.
-        session_id: The ID of the session.
-        filename: The name of the artifact file.
+        artifact_dir: The directory of the artifact.
         version: The version of the artifact.
 
     Returns:
         The constructed file path.
     """
-    artifact_dir = self._get_artifact_dir(
-        app_name, user_id, session_id, filename
-    )
     return artifact_dir / str(version)
 
-  def _get_metadata_file_path(
-      self,
-      app_name: str,
-      user_id: str,
-      session_id: str,
-      filename: str,
-      version: int,
-  ) -> Path:
+  def _get_metadata_file_path(self, artifact_dir: Path, version: int) -> Path:
     """Constructs the metadata file path for an artifact version.
 
     Args:
-        app_name: The name of the application.
-        user_id: The ID of the user.
-        session_id: The ID of the session.
-        filename: The name of the artifact file.
+        artifact_dir: The directory of the artifact.
         version: The version of the artifact.
 
     Returns:
         The constructed metadata file path.
     """
-    artifact_dir = self._get_artifact_dir(
-        app_name, user_id, session_id, filename
-    )
     return artifact_dir / f"{version}.metadata.json"
 
   def _save_artifact(
@@ -215,28 +360,19 @@ class LocalFileArtifactService(BaseArtifactService):
       filename: str,
       artifact: types.Part,
   ) -> int:
-    versions = self._list_versions(
-        app_name=app_name,
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
-    )
-    version = 0 if not versions else max(versions) + 1
-
     artifact_dir = self._get_artifact_dir(
         app_name, user_id, session_id, filename
     )
-    artifact_dir.mkdir(parents=True, exist_ok=True)
+    version = self._max_version(artifact_dir) + 1
+    # An existing version means the directory is already in place.
+    if version == 0:
+      artifact_dir.mkdir(parents=True, exist_ok=True)
 
-    artifact_file_path = self._get_artifact_file_path(
-        app_name, user_id, session_id, filename, version
-    )
-    metadata_file_path = self._get_metadata_file_path(
-        app_name, user_id, session_id, filename, version
-    )
+    artifact_file_path = self._get_artifact_file_path(artifact_dir, version)
+    metadata_file_path = self._get_metadata_file_path(artifact_dir, version)
 
     # Save the artifact data
-    artifact_file_path.write_bytes(artifact.inline_data.data)
+    _write_artifact_data(artifact_file_path, artifact.inline_data.data)
 
     # Save metadata (mime_type)
     metadata = {"mime_type": artifact.inline_data.mime_type}
@@ -244,76 +380,24 @@ class LocalFileArtifactService(BaseArtifactService):
 
     return version
 
-  def _load_artifact(
-      self,
-      app_name: str,
-      user_id: str,
-      session_id: str,
-      filename: str,
-      version: Optional[int] = None,
-  ) -> Optional[types.Part]:
-    if version is None:
-      versions = self._list_versions(
-          app_name=app_name,
-          user_id=user_id,
-          session_id=session_id,
-          filename=filename,
-      )
-      if not versions:
-        return None
-      version = max(versions)
-
-    artifact_file_path = self._get_artifact_file_path(
-        app_name, user_id, session_id, filename, version
-    )
-    metadata_file_path = self._get_metadata_file_path(
-        app_name, user_id, session_id, filename, version
-    )
-
-    if not artifact_file_path.exists() or not metadata_file_path.exists():
-      return None
-
-    try:
-      artifact_data = artifact_file_path.read_bytes()
-      metadata_text = metadata_file_path.read_text()
-      metadata = json.loads(metadata_text)
-
-      artifact = types.Part.from_bytes(
-          data=artifact_data, mime_type=metadata["mime_type"]
-      )
-      return artifact
-    except (OSError, json.JSONDecodeError, KeyError):
-      logger.warning(
-          "Failed to load artifact %s for app %s, user %s, session %s,"
-          " version %d",
-          filename,
-          app_name,
-          user_id,
-          session_id,
-          version,
-      )
-      return None
-
   def _list_artifact_keys(
       self, app_name: str, user_id: str, session_id: str
   ) -> list[str]:
-    filenames = set()
-
-    # List session-scoped artifacts
-    session_dir = self.base_path / app_name / user_id / session_id
-    if session_dir.exists():
-      for item in session_dir.iterdir():
-        if item.is_dir():
-          filenames.add(item.name)
-
-    # List user-namespaced artifacts
-    user_namespace_dir = self.base_path / app_name / user_id / "user"
-    if user_namespace_dir.exists():
-      for item in user_namespace_dir.iterdir():
-        if item.is_dir():
-          filenames.add(item.name)
-
-    return sorted(list(filenames))
+    # Session-scoped and user-namespaced artifacts are both listed.
+    user_dir = self.base_path.joinpath(app_name, user_id)
+    filenames: set[str] = set()
+    for directory in (user_dir / session_id, user_dir / "user"):
+      try:
+        with os.scandir(directory) as entries:
+          filenames.update(
+              entry.name
+              for entry in entries
+              if entry.is_dir(follow_symlinks=False)
+          )
+      except FileNotFoundError:
+        continue
+
+    return sorted(filenames)
 
   def _delete_artifact(
       self, app_name: str, user_id: str, session_id: str, filename: str
@@ -321,8 +405,41 @@ class LocalFileArtifactService(BaseArtifactService):
     artifact_dir = self._get_artifact_dir(
         app_name, user_id, session_id, filename
     )
-    if artifact_dir.exists():
+    try:
       shutil.rmtree(artifact_dir)
+    except FileNotFoundError:
+      pass
+
+  def _iter_versions(self, artifact_dir: Path) -> Iterator[int]:
+    """Yields the saved version numbers in an artifact directory.
+
+    Args:
+        artifact_dir: The directory holding the artifact versions.
+
+    Yields:
+        The version numbers, in directory order. Nothing is yielded if the
+        directory does not exist.
+    """
+    try:
+      with os.scandir(artifact_dir) as entries:
+        # Nested artifact names (e.g. "a" and "a/1") share directories, so a
+        # numeric entry is only a version when it is a regular file.
+        for entry in entries:
+          if entry.name.isdigit() and entry.is_file(follow_symlinks=False):
+            yield int(entry.name)
+    except FileNotFoundError:
+      return
+
+  def _max_version(self, artifact_dir: Path) -> int:
+    """Returns the highest saved version in an artifact directory.
+
+    Args:
+        artifact_dir: The directory holding the artifact versions.
+
+    Returns:
+        The highest version number, or -1 if the directory holds no versions.
+    """
+    return max(self._iter_versions(artifact_dir), default=-1)
 
   def _list_versions(
       self, app_name: str, user_id: str, session_id: str, filename: str
@@ -345,12 +462,4 @@ class LocalFileArtifactService(BaseArtifactService):
     artifact_dir = self._get_artifact_dir(
         app_name, user_id, session_id, filename
     )
-    if not artifact_dir.exists():
-      return []
-
-    versions = []
-    for item in artifact_dir.iterdir():
-      if item.is_file() and item.name.isdigit():
-        versions.append(int(item.name))
-
-    return sorted(versions)
+    return sorted(self._iter_versions(artifact_dir))
@@ -35,14 +35,16 @@ class _OutputSchemaRequestProcessor(BaseLlmRequestProcessor):
   async def run_async(
       self, invocation_context: InvocationContext, llm_request: LlmRequest
   ) -> AsyncGenerator[Event, None]:
-    from ...agents.llm_agent import LlmAgent
-
     agent = invocation_context.agent
-    if not isinstance(agent, LlmAgent):
+    # Most agents have no output schema, so check it before paying for the
+    # deferred import and the isinstance check.
+    if not getattr(agent, 'output_schema', None):
       return
 
+    from ...agents.llm_agent import LlmAgent
+
     # Check if we need the processor: output_schema + tools
-    if not agent.output_schema or not agent.tools:
+    if not isinstance(agent, LlmAgent) or not agent.tools:
       return
 
     # Add the set_model_response tool to handle structured output
@@ -21,14 +21,15 @@ import logging
 import os
 import sys
 from typing import AsyncGenerator
-from typing import cast
 from typing import Optional
+from typing import Sequence
 from typing import TYPE_CHECKING
 from typing import Union
 
 from google.genai import Client
 from google.genai import types
 from google.genai.types import FinishReason
+from pydantic import TypeAdapter
 from typing_extensions import override
 
 from .. import version
@@ -45,8 +46,12 @@ logger = logging.getLogger('google_adk.' + __name__)
 
 _NEW_LINE = '\n'
 _EXCLUDED_PART_FIELD = {'inline_data': {'data'}}
+_EXCLUDED_CONTENT_FIELDS = {'parts': {'__all__': _EXCLUDED_PART_FIELD}}
 _AGENT_ENGINE_TELEMETRY_TAG = 'remote_reasoning_engine'
 _AGENT_ENGINE_TELEMETRY_ENV_VARIABLE_NAME = 'GOOGLE_CLOUD_AGENT_ENGINE_ID'
+_FRAMEWORK_LABEL = f'google-adk/{version.__version__}'
+_LANGUAGE_LABEL = 'gl-python/' + sys.version.split()[0]
+_SCHEMA_PROPERTIES_ADAPTER = TypeAdapter(dict[str, types.Schema])
 
 
 class Gemini(BaseLlm):
@@ -114,7 +119,11 @@ class Gemini(BaseLlm):
         self._api_backend,
         stream,
     )
-    logger.debug(_build_request_log(llm_request))
+    # Building the request and response logs serializes every content, so
+    # skip it unless debug logging is on.
+    debug_logging = logger.isEnabledFor(logging.DEBUG)
+    if debug_logging:
+      logger.debug(_build_request_log(llm_request))
 
     # Always add tracking headers to custom headers given it will override
     # the headers set in the api client constructor to avoid tracking headers
@@ -133,8 +142,8 @@ class Gemini(BaseLlm):
           config=llm_request.config,
       )
       response = None
-      thought_text = ''
-      text = ''
+      thought_text_chunks: list[str] = []
+      text_chunks: list[str] = []
       usage_metadata = None
       # for sse, similar as bidi (see receive method in gemini_llm_connecton.py),
       # we need to mark those text content as partial and after all partial
@@ -142,49 +151,49 @@ class Gemini(BaseLlm):
       # previous partial content. The only difference is bidi rely on
       # complete_turn flag to detect end while sse depends on finish_reason.
       async for response in responses:
-        logger.debug(_build_response_log(response))
+        if debug_logging:
+          logger.debug(_build_response_log(response))
         llm_response = LlmResponse.create(response)
         usage_metadata = llm_response.usage_metadata
-        if (
-            llm_response.content
-            and llm_response.content.parts
-            and llm_response.content.parts[0].text
-        ):
-          part0 = llm_response.content.parts[0]
+        part0 = (
+            llm_response.content.parts[0]
+            if llm_response.content and llm_response.content.parts
+            else None
+        )
+        if part0 is not None and part0.inline_data:
+          # don't yield the merged text event when receiving audio data
+          yield llm_response
+          continue
+        if part0 is not None and part0.text:
           if part0.thought:
-            thought_text += part0.text
+            thought_text_chunks.append(part0.text)
           else:
-            text += part0.text
+            text_chunks.append(part0.text)
           llm_response.partial = True
-        elif (thought_text or text) and (
-            not llm_response.content
-            or not llm_response.content.parts
-            # don't yield the merged text event when receiving audio data
-            or not llm_response.content.parts[0].inline_data
-        ):
-          parts = []
-          if thought_text:
-            parts.append(types.Part(text=thought_text, thought=True))
-          if text:
-            parts.append(types.Part.from_text(text=text))
+        elif thought_text_chunks or text_chunks:
           yield LlmResponse(
-              content=types.ModelContent(parts=parts),
+              content=types.ModelContent(
+                  parts=_build_aggregated_parts(
+                      thought_text_chunks, text_chunks
+                  )
+              ),
               usage_metadata=llm_response.usage_metadata,
           )
-          thought_text = ''
-          text = ''
+          thought_text_chunks.clear()
+          text_chunks.clear()
         yield llm_response
 
       # generate an aggregated content at the end regardless the
       # response.candidates[0].finish_reason
-      if (text or thought_text) and response and response.candidates:
-        parts = []
-        if thought_text:
-          parts.append(types.Part(text=thought_text, thought=True))
-        if text:
-          parts.append(types.Part.from_text(text=text))
+      if (
+          (text_chunks or thought_text_chunks)
+          and response
+          and response.candidates
+      ):
         yield LlmResponse(
-            content=types.ModelContent(parts=parts),
+            content=types.ModelContent(
+                parts=_build_aggregated_parts(thought_text_chunks, text_chunks)
+            ),
             error_code=None
             if response.candidates[0].finish_reason == FinishReason.STOP
             else response.candidates[0].finish_reason,
@@ -201,7 +210,8 @@ class Gemini(BaseLlm):
           config=llm_request.config,
       )
       logger.info('Response received from the model.')
-      logger.debug(_build_response_log(response))
+      if debug_logging:
+        logger.debug(_build_response_log(response))
       yield LlmResponse.create(response)
 
   @cached_property
@@ -228,11 +238,12 @@ class Gemini(BaseLlm):
 
   @cached_property
   def _tracking_headers(self) -> dict[str, str]:
-    framework_label = f'google-adk/{version.__version__}'
+    # The environment variable is read per instance since it can be set after
+    # this module is imported.
+    framework_label = _FRAMEWORK_LABEL
     if os.environ.get(_AGENT_ENGINE_TELEMETRY_ENV_VARIABLE_NAME):
       framework_label = f'{framework_label}+{_AGENT_ENGINE_TELEMETRY_TAG}'
-    language_label = 'gl-python/' + sys.version.split()[0]
-    version_header_value = f'{framework_label} {language_label}'
+    version_header_value = f'{framework_label} {_LANGUAGE_LABEL}'
     tracking_headers = {
         'x-goog-api-client': version_header_value,
         'user-agent': version_header_value,
@@ -282,12 +293,18 @@ class Gemini(BaseLlm):
           self._live_api_version
       )
 
-    llm_request.live_connect_config.system_instruction = types.Content(
-        role='system',
-        parts=[
-            types.Part.from_text(text=llm_request.config.system_instruction)
-        ],
-    )
+    # Reconnects reuse the same request, so only rebuild the system content
+    # when the instruction text changed.
+    if not _is_system_content_for(
+        llm_request.live_connect_config.system_instruction,
+        llm_request.config.system_instruction,
+    ):
+      llm_request.live_connect_config.system_instruction = types.Content(
+          role='system',
+          parts=[
+              types.Part.from_text(text=llm_request.config.system_instruction)
+          ],
+      )
     llm_request.live_connect_config.tools = llm_request.config.tools
     logger.info('Connecting to live with llm_request:%s', llm_request)
     async with self._live_api_client.aio.live.connect(
@@ -322,8 +339,11 @@ class Gemini(BaseLlm):
           if not content.parts:
             continue
           for part in content.parts:
-            _remove_display_name_if_present(part.inline_data)
-            _remove_display_name_if_present(part.file_data)
+            # Most parts carry neither inline_data nor file_data.
+            if part.inline_data is not None:
+              _remove_display_name_if_present(part.inline_data)
+            if part.file_data is not None:
+              _remove_display_name_if_present(part.file_data)
 
     # Initialize config if needed
     if llm_request.config and llm_request.config.tools:
@@ -355,42 +375,42 @@ class Gemini(BaseLlm):
     return headers
 
 
+def _build_aggregated_parts(
+    thought_text_chunks: list[str], text_chunks: list[str]
+) -> list[types.Part]:
+  """Builds the parts of an aggregated streaming response from text chunks."""
+  if not thought_text_chunks:
+    return [types.Part.from_text(text=''.join(text_chunks))]
+  thought_part = types.Part(text=''.join(thought_text_chunks), thought=True)
+  if not text_chunks:
+    return [thought_part]
+  return [thought_part, types.Part.from_text(text=''.join(text_chunks))]
+
+
 def _build_function_declaration_log(
     func_decl: types.FunctionDeclaration,
 ) -> str:
   param_str = '{}'
   if func_decl.parameters and func_decl.parameters.properties:
-    param_str = str({
-        k: v.model_dump(exclude_none=True)
-        for k, v in func_decl.parameters.properties.items()
-    })
+    param_str = _SCHEMA_PROPERTIES_ADAPTER.dump_json(
+        func_decl.parameters.properties, exclude_none=True
+    ).decode()
   return_str = ''
   if func_decl.response:
-    return_str = '-> ' + str(func_decl.response.model_dump(exclude_none=True))
+    return_str = '-> ' + func_decl.response.model_dump_json(exclude_none=True)
   return f'{func_decl.name}: {param_str} {return_str}'
 
 
 def _build_request_log(req: LlmRequest) -> str:
-  function_decls: list[types.FunctionDeclaration] = cast(
-      list[types.FunctionDeclaration],
-      req.config.tools[0].function_declarations if req.config.tools else [],
-  )
-  function_logs = (
-      [
-          _build_function_declaration_log(func_decl)
-          for func_decl in function_decls
-      ]
-      if function_decls
-      else []
-  )
+  function_logs: Sequence[str] = ()
+  if req.config.tools and req.config.tools[0].function_declarations:
+    function_logs = [
+        _build_function_declaration_log(func_decl)
+        for func_decl in req.config.tools[0].function_declarations
+    ]
   contents_logs = [
       content.model_dump_json(
-          exclude_none=True,
-          exclude={
-              'parts': {
-                  i: _EXCLUDED_PART_FIELD for i in range(len(content.parts))
-              }
-          },
+          exclude_none=True, exclude=_EXCLUDED_CONTENT_FIELDS
       )
       for content in req.contents
   ]
@@ -432,6 +452,19 @@ Raw response:
 """
 
 
+def _is_system_content_for(
+    content: Optional[types.ContentUnion], text: Optional[str]
+) -> bool:
+  """Returns whether content is the system content built for the given text."""
+  return (
+      isinstance(content, types.Content)
+      and content.role == 'system'
+      and content.parts is not None
+      and len(content.parts) == 1
+      and content.parts[0].text == text
+  )
+
+
 def _remove_display_name_if_present(
     data_obj: Union[types.Blob, types.FileData, None],
 ):
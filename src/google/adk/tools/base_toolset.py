@@ -17,6 +17,7 @@ from __future__ import annotations
 from abc import ABC
 from abc import abstractmethod
 import copy
+from typing import Callable
 from typing import final
 from typing import List
 from typing import Optional
@@ -29,10 +30,38 @@ from ..agents.readonly_context import ReadonlyContext
 from .base_tool import BaseTool
 
 if TYPE_CHECKING:
+  from google.genai import types
+
   from ..models.llm_request import LlmRequest
   from .tool_context import ToolContext
 
 
+class _PrefixedDeclarationGetter:
+  """Wraps a tool's declaration getter to rename the declaration it returns.
+
+  The wrapper always wraps the getter of the original, unprefixed tool, so
+  repeated prefixing never chains wrappers.
+  """
+
+  __slots__ = ('_original_get_declaration', '_prefixed_name')
+
+  def __init__(
+      self,
+      original_get_declaration: Callable[
+          [], Optional[types.FunctionDeclaration]
+      ],
+      prefixed_name: str,
+  ):
+    self._original_get_declaration = original_get_declaration
+    self._prefixed_name = prefixed_name
+
+  def __call__(self) -> Optional[types.FunctionDeclaration]:
+    declaration = self._original_get_declaration()
+    if declaration is not None:
+      declaration.name = self._prefixed_name
+    return declaration
+
+
 @runtime_checkable
 class ToolPredicate(Protocol):
   """Base class for a predicate that defines the interface to decide whether a
@@ -123,21 +152,9 @@ class BaseToolset(ABC):
       tool_copy.name = prefixed_name
 
       # Also update the function declaration name if the tool has one
-      # Use default parameters to capture the current values in the closure
-      def _create_prefixed_declaration(
-          original_get_declaration=tool._get_declaration,
-          prefixed_name=prefixed_name,
-      ):
-        def _get_prefixed_declaration():
-          declaration = original_get_declaration()
-          if declaration is not None:
-            declaration.name = prefixed_name
-            return declaration
-          return None
-
-        return _get_prefixed_declaration
-
-      tool_copy._get_declaration = _create_prefixed_declaration()
+      tool_copy._get_declaration = _PrefixedDeclarationGetter(
+          tool._get_declaration, prefixed_name
+      )
       prefixed_tools.append(tool_copy)
 
     return prefixed_tools
@@ -158,12 +175,14 @@ class BaseToolset(ABC):
     if not self.tool_filter:
       return True
 
-    if isinstance(self.tool_filter, ToolPredicate):
-      return self.tool_filter(tool, readonly_context)
-
+    # Check for a list first: isinstance against the runtime-checkable
+    # ToolPredicate protocol is much slower than a plain type check.
     if isinstance(self.tool_filter, list):
       return tool.name in self.tool_filter
 
+    if isinstance(self.tool_filter, ToolPredicate):
+      return self.tool_filter(tool, readonly_context)
+
     return False
 
   async def process_llm_request(
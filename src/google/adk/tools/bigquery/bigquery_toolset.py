@@ -48,6 +48,23 @@ class BigQueryToolset(BaseToolset):
     self._tool_settings = (
         bigquery_tool_config if bigquery_tool_config else BigQueryToolConfig()
     )
+    # The tools only depend on the toolset configuration, so they are created
+    # once and filtered per get_tools call.
+    self._tools = [
+        GoogleTool(
+            func=func,
+            credentials_config=self._credentials_config,
+            tool_settings=self._tool_settings,
+            run_in_thread=True,
+        )
+        for func in [
+            metadata_tool.get_dataset_info,
+            metadata_tool.get_table_info,
+            metadata_tool.list_dataset_ids,
+            metadata_tool.list_table_ids,
+            query_tool.get_execute_sql(self._tool_settings),
+        ]
+    ]
 
   def _is_tool_selected(
       self, tool: BaseTool, readonly_context: ReadonlyContext
@@ -55,12 +72,12 @@ class BigQueryToolset(BaseToolset):
     if self.tool_filter is None:
       return True
 
-    if isinstance(self.tool_filter, ToolPredicate):
-      return self.tool_filter(tool, readonly_context)
-
     if isinstance(self.tool_filter, list):
       return tool.name in self.tool_filter
 
+    if isinstance(self.tool_filter, ToolPredicate):
+      return self.tool_filter(tool, readonly_context)
+
     return False
 
   @override
@@ -68,24 +85,9 @@ class BigQueryToolset(BaseToolset):
       self, readonly_context: Optional[ReadonlyContext] = None
   ) -> List[BaseTool]:
     """Get tools from the toolset."""
-    all_tools = [
-        GoogleTool(
-            func=func,
-            credentials_config=self._credentials_config,
-            tool_settings=self._tool_settings,
-        )
-        for func in [
-            metadata_tool.get_dataset_info,
-            metadata_tool.get_table_info,
-            metadata_tool.list_dataset_ids,
-            metadata_tool.list_table_ids,
-            query_tool.get_execute_sql(self._tool_settings),
-        ]
-    ]
-
     return [
         tool
-        for tool in all_tools
+        for tool in self._tools
         if self._is_tool_selected(tool, readonly_context)
     ]
 
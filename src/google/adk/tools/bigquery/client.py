@@ -14,26 +14,62 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+import threading
 from typing import Optional
 
 import google.api_core.client_info
 from google.auth.credentials import Credentials
 from google.cloud import bigquery
+import google.oauth2.credentials
 
 from ... import version
 
 USER_AGENT = f"adk-bigquery-tool google-adk/{version.__version__}"
 
+_CLIENT_CACHE_MAX_SIZE = 32
+
+# Maps (project, id(credentials)) to the credentials and the client created for
+# them. Holding the credentials keeps their id from being reused by another
+# object while the entry is cached.
+_client_cache: OrderedDict[
+    tuple[Optional[str], int], tuple[Credentials, bigquery.Client]
+] = OrderedDict()
+_client_cache_lock = threading.Lock()
+
 
 def get_bigquery_client(
     *, project: Optional[str], credentials: Credentials
 ) -> bigquery.Client:
-  """Get a BigQuery client."""
+  """Get a BigQuery client.
+
+  Clients are reused for the same project and credentials object, so that
+  repeated tool calls share the client's HTTP session and connection pool.
+  OAuth user credentials are rebuilt from the token cache on every tool call,
+  so their clients would never be reused and are not cached.
+  """
+
+  cacheable = not isinstance(credentials, google.oauth2.credentials.Credentials)
+  cache_key = (project, id(credentials))
+  if cacheable:
+    with _client_cache_lock:
+      cached = _client_cache.get(cache_key)
+      if cached is not None:
+        _client_cache.move_to_end(cache_key)
+        return cached[1]
 
   client_info = google.api_core.client_info.ClientInfo(user_agent=USER_AGENT)
 
   bigquery_client = bigquery.Client(
       project=project, credentials=credentials, client_info=client_info
   )
+  if not cacheable:
+    return bigquery_client
+
+  with _client_cache_lock:
+    _client_cache[cache_key] = (credentials, bigquery_client)
+    _client_cache.move_to_end(cache_key)
+    if len(_client_cache) > _CLIENT_CACHE_MAX_SIZE:
+      _client_cache.popitem(last=False)
 
   return bigquery_client
@@ -18,6 +18,7 @@ import functools
 import json
 import sys
 import textwrap
+import threading
 import types
 from typing import Callable
 
@@ -31,6 +32,14 @@ from .config import WriteMode
 
 BIGQUERY_SESSION_INFO_KEY = "bigquery_session_info"
 
+# Values of these types are JSON serializable as is. Anything else, including
+# containers whose items may not be serializable, is checked with json.dumps.
+_JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+# GoogleTool runs execute_sql in worker threads, so parallel calls in the same
+# session could otherwise each create a BigQuery session and race to store it.
+_bq_session_lock = threading.Lock()
+
 
 def execute_sql(
     project_id: str,
@@ -105,25 +114,28 @@ def execute_sql(
       # allowed. This artifact must have been created in a BigQuery session. In
       # such a scenario the session info (session id and the anonymous dataset
       # containing the artifact) is persisted in the tool context.
-      bq_session_info = tool_context.state.get(BIGQUERY_SESSION_INFO_KEY, None)
-      if bq_session_info:
-        bq_session_id, bq_session_dataset_id = bq_session_info
-      else:
-        session_creator_job = bq_client.query(
-            "SELECT 1",
-            project=project_id,
-            job_config=bigquery.QueryJobConfig(
-                dry_run=True, create_session=True
-            ),
-        )
-        bq_session_id = session_creator_job.session_info.session_id
-        bq_session_dataset_id = session_creator_job.destination.dataset_id
-
-        # Remember the BigQuery session info for subsequent queries
-        tool_context.state[BIGQUERY_SESSION_INFO_KEY] = (
-            bq_session_id,
-            bq_session_dataset_id,
+      with _bq_session_lock:
+        bq_session_info = tool_context.state.get(
+            BIGQUERY_SESSION_INFO_KEY, None
         )
+        if bq_session_info:
+          bq_session_id, bq_session_dataset_id = bq_session_info
+        else:
+          session_creator_job = bq_client.query(
+              "SELECT 1",
+              project=project_id,
+              job_config=bigquery.QueryJobConfig(
+                  dry_run=True, create_session=True
+              ),
+          )
+          bq_session_id = session_creator_job.session_info.session_id
+          bq_session_dataset_id = session_creator_job.destination.dataset_id
+
+          # Remember the BigQuery session info for subsequent queries
+          tool_context.state[BIGQUERY_SESSION_INFO_KEY] = (
+              bq_session_id,
+              bq_session_dataset_id,
+          )
 
       # Session connection property will be set in the query execution
       bq_connection_properties = [
@@ -167,11 +179,12 @@ def execute_sql(
     for row in row_iterator:
       row_values = {}
       for key, val in row.items():
-        try:
-          # if the json serialization of the value succeeds, use it as is
-          json.dumps(val)
-        except:
-          val = str(val)
+        if not isinstance(val, _JSON_SCALAR_TYPES):
+          try:
+            # if the json serialization of the value succeeds, use it as is
+            json.dumps(val)
+          except:
+            val = str(val)
         row_values[key] = val
       rows.append(row_values)
 
@@ -474,7 +487,22 @@ def get_execute_sql(settings: BigQueryToolConfig) -> Callable[..., dict]:
       settings.
   """
 
-  if not settings or settings.write_mode == WriteMode.BLOCKED:
+  if not settings:
+    return execute_sql
+  return _get_execute_sql_for_write_mode(settings.write_mode)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_execute_sql_for_write_mode(
+    write_mode: WriteMode,
+) -> Callable[..., dict]:
+  """Get the execute_sql tool for the given write mode.
+
+  The tool only depends on the write mode, so it is built once per mode and
+  shared across toolsets and get_tools calls.
+  """
+
+  if write_mode == WriteMode.BLOCKED:
     return execute_sql
 
   # Create a new function object using the original function's code and globals.
@@ -495,7 +523,7 @@ def get_execute_sql(settings: BigQueryToolConfig) -> Callable[..., dict]:
   functools.update_wrapper(execute_sql_wrapper, execute_sql)
 
   # Now, set the new docstring
-  if settings.write_mode == WriteMode.PROTECTED:
+  if write_mode == WriteMode.PROTECTED:
     examples = _execute_sql_protecetd_write_examples
   else:
     examples = _execute_sql_write_examples
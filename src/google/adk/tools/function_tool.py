@@ -115,7 +115,15 @@ You could retry calling this tool, but it is IMPORTANT for you to provide all th
     ):
       return await self.func(**args_to_call)
     else:
-      return self.func(**args_to_call)
+      return await self._run_sync_func(args_to_call)
+
+  async def _run_sync_func(self, args_to_call: dict[str, Any]) -> Any:
+    """Calls the wrapped synchronous function with the given arguments.
+
+    Subclasses wrapping functions that block on I/O can override this to run
+    them off the event loop.
+    """
+    return self.func(**args_to_call)
 
   # TODO(hangfei): fix call live for function stream.
   async def _call_live(
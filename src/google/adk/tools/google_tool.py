@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 from typing import Any
 from typing import Callable
@@ -48,6 +49,7 @@ class GoogleTool(FunctionTool):
       *,
       credentials_config: Optional[BaseGoogleCredentialsConfig] = None,
       tool_settings: Optional[BaseModel] = None,
+      run_in_thread: bool = False,
   ):
     """Initialize the Google API tool.
 
@@ -58,6 +60,10 @@ class GoogleTool(FunctionTool):
           then we don't hanlde the auth logic
         tool_settings: Tool-specific settings. This settings should be provided
           by each toolset that uses this class to create customized tools.
+        run_in_thread: Whether to run a synchronous func in a worker thread
+          instead of on the event loop. Parallel function calls then run
+          concurrently, so only enable this for functions that are safe to run
+          alongside each other.
     """
     super().__init__(func=func)
     self._ignore_params.append("credentials")
@@ -68,6 +74,7 @@ class GoogleTool(FunctionTool):
         else None
     )
     self._tool_settings = tool_settings
+    self._run_in_thread = run_in_thread
 
   @override
   async def run_async(
@@ -130,3 +137,11 @@ class GoogleTool(FunctionTool):
     if "settings" in signature.parameters:
       args_to_call["settings"] = tool_settings
     return await super().run_async(args=args_to_call, tool_context=tool_context)
+
+  @override
+  async def _run_sync_func(self, args_to_call: dict[str, Any]) -> Any:
+    if not self._run_in_thread:
+      return await super()._run_sync_func(args_to_call)
+    # Google API client calls block on network I/O, e.g. while waiting for a
+    # BigQuery job, so run them in a worker thread to keep the event loop free.
+    return await asyncio.to_thread(self.func, **args_to_call)
@@ -58,12 +58,12 @@ class SpannerToolset(BaseToolset):
     if self.tool_filter is None:
       return True
 
-    if isinstance(self.tool_filter, ToolPredicate):
-      return self.tool_filter(tool, readonly_context)
-
     if isinstance(self.tool_filter, list):
       return tool.name in self.tool_filter
 
+    if isinstance(self.tool_filter, ToolPredicate):
+      return self.tool_filter(tool, readonly_context)
+
     return False
 
   @override
@@ -76,6 +76,7 @@ class SpannerToolset(BaseToolset):
             func=func,
             credentials_config=self._credentials_config,
             tool_settings=self._tool_settings,
+            run_in_thread=True,
         )
         for func in [
             # Metadata tools
@@ -97,6 +98,7 @@ class SpannerToolset(BaseToolset):
               func=query_tool.execute_sql,
               credentials_config=self._credentials_config,
               tool_settings=self._tool_settings,
+              run_in_thread=True,
           )
       )
 
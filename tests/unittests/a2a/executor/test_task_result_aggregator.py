@@ -335,3 +335,18 @@ class TestTaskResultAggregator:
     assert (
         self.aggregator.task_status_message == auth_message
     )  # Message unchanged because task state is not working
+
+  def test_untracked_state_does_not_override_working(self):
+    """Test that states outside the priority list only update the message."""
+    completed_message = create_test_message("Completed")
+    event = TaskStatusUpdateEvent(
+        task_id="test-task",
+        context_id="test-context",
+        status=TaskStatus(state=TaskState.completed, message=completed_message),
+        final=True,
+    )
+
+    self.aggregator.process_event(event)
+    assert self.aggregator.task_state == TaskState.working
+    assert self.aggregator.task_status_message == completed_message
+    assert event.status.state == TaskState.working
@@ -17,7 +17,9 @@
 import json
 from pathlib import Path
 import tempfile
+from unittest import mock
 
+from google.adk.artifacts.local_file_artifact_service import _LARGE_ARTIFACT_SIZE_BYTES
 from google.adk.artifacts.local_file_artifact_service import LocalFileArtifactService
 from google.genai import types
 import pytest
@@ -516,3 +518,228 @@ async def test_missing_metadata_file(artifact_service, temp_dir):
   )
 
   assert loaded_artifact is None
+
+
+@pytest.mark.asyncio
+async def test_save_load_large_artifact(artifact_service, temp_dir):
+  """Tests that large artifacts are written and read back intact."""
+  data = bytes(range(256)) * (_LARGE_ARTIFACT_SIZE_BYTES // 256) + b"\x00"
+  artifact = types.Part.from_bytes(data=data, mime_type="audio/wav")
+  app_name = "app0"
+  user_id = "user0"
+  session_id = "123"
+  filename = "large_file"
+
+  await artifact_service.save_artifact(
+      app_name=app_name,
+      user_id=user_id,
+      session_id=session_id,
+      filename=filename,
+      artifact=artifact,
+  )
+
+  artifact_path = Path(temp_dir) / app_name / user_id / session_id / filename
+  assert (artifact_path / "0").stat().st_size == len(data)
+
+  loaded_artifact = await artifact_service.load_artifact(
+      app_name=app_name,
+      user_id=user_id,
+      session_id=session_id,
+      filename=filename,
+  )
+  assert loaded_artifact == artifact
+
+
+@pytest.mark.asyncio
+async def test_list_versions_ignores_nested_artifact_dirs(artifact_service):
+  """Tests that a nested artifact named like a version is not a version."""
+  artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
+  app_name = "app0"
+  user_id = "user0"
+  session_id = "123"
+
+  for filename in ("parent", "parent/1"):
+    await artifact_service.save_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        artifact=artifact,
+    )
+
+  assert (
+      await artifact_service.list_versions(
+          app_name=app_name,
+          user_id=user_id,
+          session_id=session_id,
+          filename="parent",
+      )
+      == [0]
+  )
+
+
+@pytest.mark.asyncio
+async def test_load_artifact_is_cached_until_deleted(artifact_service):
+  """Tests that repeated loads are served from the in-memory cache."""
+  artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
+  app_name = "app0"
+  user_id = "user0"
+  session_id = "123"
+
+  for filename in ("parent", "parent/child"):
+    await artifact_service.save_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        artifact=artifact,
+    )
+    await artifact_service.load_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+    )
+
+  with mock.patch.object(Path, "read_bytes", side_effect=OSError("no disk")):
+    for filename in ("parent", "parent/child"):
+      assert (
+          await artifact_service.load_artifact(
+              app_name=app_name,
+              user_id=user_id,
+              session_id=session_id,
+              filename=filename,
+              version=0,
+          )
+          == artifact
+      )
+
+  # Deleting the parent also removes the nested artifact from disk.
+  await artifact_service.delete_artifact(
+      app_name=app_name,
+      user_id=user_id,
+      session_id=session_id,
+      filename="parent",
+  )
+  for filename in ("parent", "parent/child"):
+    assert not await artifact_service.load_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        version=0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_load_artifact_cache_sees_changes_from_other_services(temp_dir):
+  """Tests that cached versions are revalidated against the file on disk."""
+  service = LocalFileArtifactService(base_path=temp_dir)
+  other_service = LocalFileArtifactService(base_path=temp_dir)
+  app_name = "app0"
+  user_id = "user0"
+  session_id = "123"
+  filename = "file.txt"
+
+  await service.save_artifact(
+      app_name=app_name,
+      user_id=user_id,
+      session_id=session_id,
+      filename=filename,
+      artifact=types.Part.from_bytes(data=b"old", mime_type="text/plain"),
+  )
+  await service.load_artifact(
+      app_name=app_name,
+      user_id=user_id,
+      session_id=session_id,
+      filename=filename,
+  )
+
+  new_artifact = types.Part.from_bytes(data=b"new data", mime_type="text/plain")
+  await other_service.delete_artifact(
+      app_name=app_name,
+      user_id=user_id,
+      session_id=session_id,
+      filename=filename,
+  )
+  await other_service.save_artifact(
+      app_name=app_name,
+      user_id=user_id,
+      session_id=session_id,
+      filename=filename,
+      artifact=new_artifact,
+  )
+
+  assert (
+      await service.load_artifact(
+          app_name=app_name,
+          user_id=user_id,
+          session_id=session_id,
+          filename=filename,
+          version=0,
+      )
+      == new_artifact
+  )
+
+
+@pytest.mark.asyncio
+async def test_load_artifact_cache_skips_large_artifacts(artifact_service):
+  """Tests that artifacts at or above the large size are not cached."""
+  app_name = "app0"
+  user_id = "user0"
+  session_id = "123"
+
+  for filename, size in (
+      ("small", 16),
+      ("large", _LARGE_ARTIFACT_SIZE_BYTES),
+  ):
+    await artifact_service.save_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        artifact=types.Part.from_bytes(data=bytes(size), mime_type="audio/wav"),
+    )
+    await artifact_service.load_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+    )
+
+  assert [
+      cached_dir.name for cached_dir, _ in artifact_service._load_cache
+  ] == ["small"]
+  assert artifact_service._load_cache_bytes == 16
+
+
+@pytest.mark.asyncio
+async def test_load_artifact_cache_caps_entries(artifact_service):
+  """Tests that the cache evicts small artifacts beyond its entry cap."""
+  app_name = "app0"
+  user_id = "user0"
+  session_id = "123"
+  filenames = [f"empty{i}" for i in range(5)]
+
+  with mock.patch(
+      "google.adk.artifacts.local_file_artifact_service._LOAD_CACHE_MAX_ENTRIES",
+      3,
+  ):
+    for filename in filenames:
+      await artifact_service.save_artifact(
+          app_name=app_name,
+          user_id=user_id,
+          session_id=session_id,
+          filename=filename,
+          artifact=types.Part.from_bytes(data=b"", mime_type="text/plain"),
+      )
+      await artifact_service.load_artifact(
+          app_name=app_name,
+          user_id=user_id,
+          session_id=session_id,
+          filename=filename,
+      )
+
+  assert [
+      cached_dir.name for cached_dir, _ in artifact_service._load_cache
+  ] == filenames[-3:]
@@ -19,11 +19,21 @@ import json
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.agents.llm_agent import LlmAgent
 from google.adk.agents.run_config import RunConfig
+from google.adk.events.event import Event
+from google.adk.flows.llm_flows._output_schema_processor import _OutputSchemaRequestProcessor
+from google.adk.flows.llm_flows._output_schema_processor import create_final_model_response_event
+from google.adk.flows.llm_flows._output_schema_processor import get_structured_model_response
+from google.adk.flows.llm_flows.base_llm_flow import BaseLlmFlow
+from google.adk.flows.llm_flows.basic import _BasicLlmRequestProcessor
 from google.adk.flows.llm_flows.single_flow import SingleFlow
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.adk.tools.function_tool import FunctionTool
+from google.adk.tools.set_model_response_tool import MODEL_JSON_RESPONSE_KEY
+from google.adk.tools.set_model_response_tool import SetModelResponseTool
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
 from pydantic import BaseModel
 from pydantic import Field
 import pytest
@@ -75,8 +85,6 @@ async def test_output_schema_with_tools_validation_removed():
 @pytest.mark.asyncio
 async def test_basic_processor_skips_output_schema_with_tools():
   """Test that basic processor doesn't set output_schema when tools are present."""
-  from google.adk.flows.llm_flows.basic import _BasicLlmRequestProcessor
-
   agent = LlmAgent(
       name='test_agent',
       model='gemini-1.5-flash',
@@ -90,9 +98,8 @@ async def test_basic_processor_skips_output_schema_with_tools():
   processor = _BasicLlmRequestProcessor()
 
   # Process the request
-  events = []
-  async for event in processor.run_async(invocation_context, llm_request):
-    events.append(event)
+  async for _ in processor.run_async(invocation_context, llm_request):
+    pass
 
   # Should not have set response_schema since agent has tools
   assert llm_request.config.response_schema is None
@@ -102,8 +109,6 @@ async def test_basic_processor_skips_output_schema_with_tools():
 @pytest.mark.asyncio
 async def test_basic_processor_sets_output_schema_without_tools():
   """Test that basic processor still sets output_schema when no tools are present."""
-  from google.adk.flows.llm_flows.basic import _BasicLlmRequestProcessor
-
   agent = LlmAgent(
       name='test_agent',
       model='gemini-1.5-flash',
@@ -117,9 +122,8 @@ async def test_basic_processor_sets_output_schema_without_tools():
   processor = _BasicLlmRequestProcessor()
 
   # Process the request
-  events = []
-  async for event in processor.run_async(invocation_context, llm_request):
-    events.append(event)
+  async for _ in processor.run_async(invocation_context, llm_request):
+    pass
 
   # Should have set response_schema since agent has no tools
   assert llm_request.config.response_schema == PersonSchema
@@ -129,8 +133,6 @@ async def test_basic_processor_sets_output_schema_without_tools():
 @pytest.mark.asyncio
 async def test_output_schema_request_processor():
   """Test that output schema processor adds set_model_response tool."""
-  from google.adk.flows.llm_flows._output_schema_processor import _OutputSchemaRequestProcessor
-
   agent = LlmAgent(
       name='test_agent',
       model='gemini-1.5-flash',
@@ -144,9 +146,8 @@ async def test_output_schema_request_processor():
   processor = _OutputSchemaRequestProcessor()
 
   # Process the request
-  events = []
-  async for event in processor.run_async(invocation_context, llm_request):
-    events.append(event)
+  async for _ in processor.run_async(invocation_context, llm_request):
+    pass
 
   # Should have added set_model_response tool
   assert 'set_model_response' in llm_request.tools_dict
@@ -158,10 +159,6 @@ async def test_output_schema_request_processor():
 @pytest.mark.asyncio
 async def test_set_model_response_tool():
   """Test the set_model_response tool functionality."""
-  from google.adk.tools.set_model_response_tool import MODEL_JSON_RESPONSE_KEY
-  from google.adk.tools.set_model_response_tool import SetModelResponseTool
-  from google.adk.tools.tool_context import ToolContext
-
   tool = SetModelResponseTool(PersonSchema)
 
   agent = LlmAgent(name='test_agent', model='gemini-1.5-flash')
@@ -190,11 +187,6 @@ async def test_set_model_response_tool():
 @pytest.mark.asyncio
 async def test_output_schema_helper_functions():
   """Test the helper functions for handling set_model_response."""
-  from google.adk.events.event import Event
-  from google.adk.flows.llm_flows._output_schema_processor import create_final_model_response_event
-  from google.adk.flows.llm_flows._output_schema_processor import get_structured_model_response
-  from google.genai import types
-
   agent = LlmAgent(
       name='test_agent',
       model='gemini-1.5-flash',
@@ -285,11 +277,6 @@ async def test_end_to_end_integration():
 @pytest.mark.asyncio
 async def test_flow_yields_both_events_for_set_model_response():
   """Test that the flow yields both function response and final model response events."""
-  from google.adk.events.event import Event
-  from google.adk.flows.llm_flows.base_llm_flow import BaseLlmFlow
-  from google.adk.tools.set_model_response_tool import SetModelResponseTool
-  from google.genai import types
-
   agent = LlmAgent(
       name='test_agent',
       model='gemini-1.5-flash',
@@ -358,10 +345,6 @@ async def test_flow_yields_both_events_for_set_model_response():
 @pytest.mark.asyncio
 async def test_flow_yields_only_function_response_for_normal_tools():
   """Test that the flow yields only function response event for non-set_model_response tools."""
-  from google.adk.events.event import Event
-  from google.adk.flows.llm_flows.base_llm_flow import BaseLlmFlow
-  from google.genai import types
-
   agent = LlmAgent(
       name='test_agent',
       model='gemini-1.5-flash',
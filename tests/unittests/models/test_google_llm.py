@@ -22,6 +22,8 @@ from google.adk import version as adk_version
 from google.adk.models.gemini_llm_connection import GeminiLlmConnection
 from google.adk.models.google_llm import _AGENT_ENGINE_TELEMETRY_ENV_VARIABLE_NAME
 from google.adk.models.google_llm import _AGENT_ENGINE_TELEMETRY_TAG
+from google.adk.models.google_llm import _build_function_declaration_log
+from google.adk.models.google_llm import _build_request_log
 from google.adk.models.google_llm import Gemini
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
@@ -227,6 +229,90 @@ async def test_generate_content_async(
     mock_client.aio.models.generate_content.assert_called_once()
 
 
+def test_build_request_log_excludes_inline_data_bytes():
+  llm_request = LlmRequest(
+      model="gemini-1.5-flash",
+      contents=[
+          Content(
+              role="user",
+              parts=[
+                  Part.from_text(text="Describe this image"),
+                  Part.from_bytes(data=b"image_bytes", mime_type="image/png"),
+              ],
+          ),
+          Content(role="model"),
+      ],
+      config=types.GenerateContentConfig(system_instruction="Be helpful"),
+  )
+
+  log = _build_request_log(llm_request)
+
+  assert "Describe this image" in log
+  assert '"inline_data":{"mime_type":"image/png"}' in log
+  assert "aW1hZ2VfYnl0ZXM" not in log
+  assert '{"role":"model"}' in log
+
+
+def test_build_function_declaration_log():
+  func_decl = types.FunctionDeclaration(
+      name="get_weather",
+      parameters=types.Schema(
+          type=types.Type.OBJECT,
+          properties={
+              "city": types.Schema(
+                  type=types.Type.STRING, description="The city."
+              )
+          },
+      ),
+      response=types.Schema(type=types.Type.STRING),
+  )
+
+  log = _build_function_declaration_log(func_decl)
+
+  assert log == (
+      'get_weather: {"city":{"description":"The city.","type":"STRING"}}'
+      ' -> {"type":"STRING"}'
+  )
+  assert (
+      _build_function_declaration_log(types.FunctionDeclaration(name="noop"))
+      == "noop: {} "
+  )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("debug_enabled", [True, False])
+async def test_generate_content_async_builds_logs_only_for_debug(
+    gemini_llm, llm_request, generate_content_response, debug_enabled
+):
+  mock_build_request_log = mock.Mock(return_value="request")
+  mock_build_response_log = mock.Mock(return_value="response")
+  with mock.patch.object(gemini_llm, "api_client") as mock_client, mock.patch(
+      "google.adk.models.google_llm.logger.isEnabledFor",
+      return_value=debug_enabled,
+  ), mock.patch(
+      "google.adk.models.google_llm._build_request_log",
+      mock_build_request_log,
+  ), mock.patch(
+      "google.adk.models.google_llm._build_response_log",
+      mock_build_response_log,
+  ):
+
+    async def mock_coro():
+      return generate_content_response
+
+    mock_client.aio.models.generate_content.return_value = mock_coro()
+
+    _ = [
+        resp
+        async for resp in gemini_llm.generate_content_async(
+            llm_request, stream=False
+        )
+    ]
+
+  assert mock_build_request_log.called == debug_enabled
+  assert mock_build_response_log.called == debug_enabled
+
+
 @pytest.mark.asyncio
 async def test_generate_content_async_stream(gemini_llm, llm_request):
   with mock.patch.object(gemini_llm, "api_client") as mock_client:
@@ -287,6 +373,70 @@ async def test_generate_content_async_stream(gemini_llm, llm_request):
     mock_client.aio.models.generate_content_stream.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_generate_content_async_stream_passes_audio_through(
+    gemini_llm, llm_request
+):
+  with mock.patch.object(gemini_llm, "api_client") as mock_client:
+    mock_responses = [
+        types.GenerateContentResponse(
+            candidates=[
+                types.Candidate(
+                    content=Content(
+                        role="model", parts=[Part.from_text(text="Hello")]
+                    ),
+                    finish_reason=None,
+                )
+            ]
+        ),
+        types.GenerateContentResponse(
+            candidates=[
+                types.Candidate(
+                    content=Content(
+                        role="model",
+                        parts=[
+                            Part.from_bytes(
+                                data=b"audio", mime_type="audio/pcm"
+                            )
+                        ],
+                    ),
+                    finish_reason=None,
+                )
+            ]
+        ),
+        types.GenerateContentResponse(
+            candidates=[
+                types.Candidate(
+                    content=Content(
+                        role="model", parts=[Part.from_text(text=" world")]
+                    ),
+                    finish_reason=types.FinishReason.STOP,
+                )
+            ]
+        ),
+    ]
+
+    async def mock_coro():
+      return MockAsyncIterator(mock_responses)
+
+    mock_client.aio.models.generate_content_stream.return_value = mock_coro()
+
+    responses = [
+        resp
+        async for resp in gemini_llm.generate_content_async(
+            llm_request, stream=True
+        )
+    ]
+
+    # The audio chunk neither flushes nor joins the accumulated text.
+    assert len(responses) == 4
+    assert responses[0].partial is True
+    assert responses[1].content.parts[0].inline_data.data == b"audio"
+    assert not responses[1].partial
+    assert responses[2].partial is True
+    assert responses[3].content.parts[0].text == "Hello world"
+
+
 @pytest.mark.asyncio
 async def test_generate_content_async_stream_preserves_thinking_and_text_parts(
     gemini_llm, llm_request
@@ -592,6 +742,43 @@ async def test_connect_with_custom_headers(gemini_llm, llm_request):
       assert isinstance(connection, GeminiLlmConnection)
 
 
+@pytest.mark.asyncio
+async def test_connect_reuses_unchanged_system_instruction(
+    gemini_llm, llm_request
+):
+  """Test that reconnecting with the same request keeps the system content."""
+  llm_request.live_connect_config = types.LiveConnectConfig()
+
+  class MockLiveConnect:
+
+    async def __aenter__(self):
+      return mock.AsyncMock()
+
+    async def __aexit__(self, *args):
+      pass
+
+  with mock.patch.object(gemini_llm, "_live_api_client") as mock_live_client:
+    mock_live_client.aio.live.connect.side_effect = (
+        lambda **kwargs: MockLiveConnect()
+    )
+
+    async with gemini_llm.connect(llm_request):
+      pass
+    system_content = llm_request.live_connect_config.system_instruction
+    assert system_content.parts[0].text == "You are a helpful assistant"
+
+    async with gemini_llm.connect(llm_request):
+      pass
+    assert llm_request.live_connect_config.system_instruction is system_content
+
+    llm_request.config.system_instruction = "You are a pirate"
+    async with gemini_llm.connect(llm_request):
+      pass
+    system_content = llm_request.live_connect_config.system_instruction
+    assert system_content.role == "system"
+    assert system_content.parts[0].text == "You are a pirate"
+
+
 @pytest.mark.asyncio
 async def test_connect_without_custom_headers(gemini_llm, llm_request):
   """Test that connect method works properly when no custom headers are provided."""
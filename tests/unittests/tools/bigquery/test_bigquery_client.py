@@ -18,12 +18,21 @@ import os
 import re
 from unittest import mock
 
+from google.adk.tools.bigquery import client as client_lib
 from google.adk.tools.bigquery.client import get_bigquery_client
+import google.auth.credentials
 from google.auth.exceptions import DefaultCredentialsError
 from google.oauth2.credentials import Credentials
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+  """Keeps clients cached by one test from leaking into the others."""
+  with mock.patch.dict(client_lib._client_cache, clear=True):
+    yield
+
+
 def test_bigquery_client_project():
   """Test BigQuery client project."""
   # Trigger the BigQuery client creation
@@ -128,3 +137,47 @@ def test_bigquery_client_user_agent():
         r"adk-bigquery-tool google-adk/([0-9A-Za-z._\-+/]+)",
         client_info_arg.user_agent,
     )
+
+
+def test_bigquery_client_reused_for_same_credentials():
+  """Test BigQuery client is reused for the same project and credentials."""
+  credentials = mock.create_autospec(
+      google.auth.credentials.Credentials, instance=True
+  )
+
+  client = get_bigquery_client(
+      project="test-gcp-project", credentials=credentials
+  )
+
+  assert (
+      get_bigquery_client(project="test-gcp-project", credentials=credentials)
+      is client
+  )
+  assert (
+      get_bigquery_client(project="other-gcp-project", credentials=credentials)
+      is not client
+  )
+  assert (
+      get_bigquery_client(
+          project="test-gcp-project",
+          credentials=mock.create_autospec(
+              google.auth.credentials.Credentials, instance=True
+          ),
+      )
+      is not client
+  )
+
+
+def test_bigquery_client_not_cached_for_oauth_credentials():
+  """Test BigQuery clients for OAuth user credentials are not cached."""
+  credentials = mock.create_autospec(Credentials, instance=True)
+
+  client = get_bigquery_client(
+      project="test-gcp-project", credentials=credentials
+  )
+
+  assert not client_lib._client_cache
+  assert (
+      get_bigquery_client(project="test-gcp-project", credentials=credentials)
+      is not client
+  )
@@ -14,10 +14,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 import decimal
 import os
 import textwrap
+import time
 from typing import Optional
 from unittest import mock
 
@@ -29,6 +31,7 @@ from google.adk.tools.bigquery import BigQueryToolset
 from google.adk.tools.bigquery.config import BigQueryToolConfig
 from google.adk.tools.bigquery.config import WriteMode
 from google.adk.tools.bigquery.query_tool import execute_sql
+from google.adk.tools.bigquery.query_tool import get_execute_sql
 from google.adk.tools.tool_context import ToolContext
 from google.auth.exceptions import DefaultCredentialsError
 from google.cloud import bigquery
@@ -797,6 +800,56 @@ def test_execute_sql_non_select_stmt_write_protected_persistent_target(
     }
 
 
+@pytest.mark.asyncio
+async def test_execute_sql_write_protected_concurrent_calls_share_session():
+  """Test parallel execute_sql calls create a single BigQuery session."""
+  project = "my_project"
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_settings = BigQueryToolConfig(write_mode=WriteMode.PROTECTED)
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+  tool_context.state = {}
+  created_session_ids = []
+
+  def query(query, project, job_config):
+    query_job = mock.create_autospec(bigquery.QueryJob)
+    if job_config.create_session:
+      # Widen the window in which an unguarded second call would also find
+      # no session in the state.
+      time.sleep(0.1)
+      created_session_ids.append(f"session-{len(created_session_ids)}")
+      query_job.session_info.session_id = created_session_ids[-1]
+      query_job.destination.dataset_id = "_anonymous_dataset"
+    else:
+      query_job.statement_type = "SELECT"
+    return query_job
+
+  with mock.patch("google.cloud.bigquery.Client", autospec=False) as Client:
+    bq_client = Client.return_value
+    bq_client.query.side_effect = query
+    bq_client.query_and_wait.return_value = []
+
+    results = await asyncio.gather(*(
+        asyncio.to_thread(
+            execute_sql,
+            project,
+            "SELECT 1",
+            credentials,
+            tool_settings,
+            tool_context,
+        )
+        for _ in range(2)
+    ))
+
+  assert results == [{"status": "SUCCESS", "rows": []}] * 2
+  assert created_session_ids == ["session-0"]
+  assert tool_context.state == {
+      "bigquery_session_info": ("session-0", "_anonymous_dataset")
+  }
+  for call in bq_client.query_and_wait.call_args_list:
+    (connection_property,) = call.kwargs["job_config"].connection_properties
+    assert connection_property.value == "session-0"
+
+
 @pytest.mark.parametrize(
     ("write_mode",),
     [
@@ -983,3 +1036,24 @@ def test_execute_sql_result_dtype(
   # Test the tool worked without invoking default auth
   result = execute_sql(project, query, credentials, tool_settings, tool_context)
   assert result == {"status": "SUCCESS", "rows": tool_result_rows}
+
+
+@pytest.mark.parametrize(
+    ("write_mode",),
+    [
+        pytest.param(WriteMode.BLOCKED, id="blocked"),
+        pytest.param(WriteMode.PROTECTED, id="protected"),
+        pytest.param(WriteMode.ALLOWED, id="allowed"),
+    ],
+)
+def test_get_execute_sql_is_shared_per_write_mode(write_mode):
+  """Test that get_execute_sql reuses the tool function for a write mode."""
+  tool = get_execute_sql(BigQueryToolConfig(write_mode=write_mode))
+
+  assert tool is get_execute_sql(BigQueryToolConfig(write_mode=write_mode))
+  assert tool.__name__ == "execute_sql"
+  if write_mode == WriteMode.BLOCKED:
+    assert tool is execute_sql
+  else:
+    assert tool is not execute_sql
+    assert tool.__doc__ != execute_sql.__doc__
@@ -126,3 +126,18 @@ async def test_bigquery_toolset_unknown_tool(selected_tools, returned_tools):
   expected_tool_names = set(returned_tools)
   actual_tool_names = set([tool.name for tool in tools])
   assert actual_tool_names == expected_tool_names
+
+
+@pytest.mark.asyncio
+async def test_bigquery_toolset_reuses_tools():
+  """Test that the BigQuery toolset returns the same tools across calls."""
+  credentials_config = BigQueryCredentialsConfig(
+      client_id="abc", client_secret="def"
+  )
+  toolset = BigQueryToolset(credentials_config=credentials_config)
+
+  tools = await toolset.get_tools()
+  tools_again = await toolset.get_tools()
+
+  assert len(tools) == 5
+  assert all(tool is tool_again for tool, tool_again in zip(tools, tools_again))
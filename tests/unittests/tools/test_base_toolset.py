@@ -72,7 +72,7 @@ async def test_process_llm_request_default_implementation():
   llm_request = LlmRequest()
 
   # The default implementation should not modify the request
-  original_request = LlmRequest.model_validate(llm_request.model_dump())
+  original_request = llm_request.model_copy(deep=True)
 
   await toolset.process_llm_request(
       tool_context=tool_context, llm_request=llm_request
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 
+import threading
 from unittest.mock import Mock
 from unittest.mock import patch
 
@@ -188,6 +189,56 @@ class TestGoogleTool:
     assert result["result"] == "Success with test_value"
     assert result["authenticated"] is False
 
+  @pytest.mark.asyncio
+  async def test_run_async_runs_sync_function_in_worker_thread(
+      self, mock_tool_context
+  ):
+    """Test that opted-in sync functions do not block the event loop thread.
+
+    Google API client calls block on network I/O, so synchronous tool
+    functions that opt in should run in a worker thread.
+    """
+    calling_threads = []
+
+    def blocking_function(param1: str) -> dict:
+      calling_threads.append(threading.current_thread())
+      return {"result": f"Success with {param1}"}
+
+    tool = GoogleTool(
+        func=blocking_function, credentials_config=None, run_in_thread=True
+    )
+
+    result = await tool.run_async(
+        args={"param1": "test_value"}, tool_context=mock_tool_context
+    )
+
+    assert result["result"] == "Success with test_value"
+    assert calling_threads
+    assert calling_threads[0] is not threading.current_thread()
+
+  @pytest.mark.asyncio
+  async def test_run_async_runs_sync_function_on_event_loop_by_default(
+      self, mock_tool_context
+  ):
+    """Test that sync functions run on the event loop unless they opt in.
+
+    Functions may mutate shared session state, so they must not start running
+    concurrently with parallel function calls without opting in.
+    """
+    calling_threads = []
+
+    def sync_function(param1: str) -> dict:
+      calling_threads.append(threading.current_thread())
+      return {"result": f"Success with {param1}"}
+
+    tool = GoogleTool(func=sync_function, credentials_config=None)
+
+    await tool.run_async(
+        args={"param1": "test_value"}, tool_context=mock_tool_context
+    )
+
+    assert calling_threads == [threading.current_thread()]
+
   @pytest.mark.asyncio
   async def test_run_async_with_async_function(
       self, async_sample_function, credentials_config, mock_tool_context